@@ -1,18 +1,28 @@
-import sys, os, json, shutil
-from pathlib import Path
+import sys, os, errno, json, shutil, argparse, time, unicodedata, operator
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePath
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
-    QFileDialog, QListWidget, QListWidgetItem, QLabel, QDialog, QTableWidget,
+    QFileDialog, QListView, QLabel, QDialog, QTableWidget,
     QTableWidgetItem, QHeaderView, QAbstractItemView, QMessageBox, QStyle,
     QStyleOptionButton, QStylePainter
 )
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt, QSize, QObject, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QSize, QObject, QThread, pyqtSignal, QAbstractListModel, QModelIndex
+try:
+    import orjson                                 # optional, much faster serialisation
+except ImportError:
+    orjson = None
 
 # ---------------------------------------------------------------
 # Config persistence helpers
 # ---------------------------------------------------------------
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PROGRESS_EVERY, PROGRESS_INTERVAL = 16, 0.05     # emit progress every N files or T seconds
+ERRORS_SHOWN = 20                                  # error lines in a dialog body; the rest go to details
 RULES_FILE = Path.home() / ".file_organizer_rules.json"
+UNDO_LOG   = Path.home() / ".file_organizer_undo.jsonl"   # one [dest, src] pair per line
 DEFAULT_RULES = {
     ".jpg": "Images", ".jpeg": "Images", ".png": "Images",
     ".pdf": "Documents", ".docx": "Documents", ".txt": "Documents",
@@ -20,6 +30,12 @@ DEFAULT_RULES = {
     ".mp3": "Audio", ".wav": "Audio",
 }
 
+def _dumps(obj, indent: bool = False) -> bytes:
+    if orjson is not None:
+        try: return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError: pass                    # e.g. surrogate-escaped file names
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
 def load_rules() -> dict[str, str]:
     try:
         if RULES_FILE.exists():
@@ -32,11 +48,25 @@ def load_rules() -> dict[str, str]:
 
 def save_rules(rules: dict[str, str]):
     try:
-        with RULES_FILE.open("w", encoding="utf-8") as fp:
-            json.dump(rules, fp, indent=2)
+        RULES_FILE.write_bytes(_dumps(rules, indent=True))
     except Exception as e:
         QMessageBox.warning(None, "Save Error", f"Could not save rules:\n{e}")
 
+def load_undo_log() -> list[list[str]]:
+    moves = []
+    try:
+        with UNDO_LOG.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                try: moves.append(json.loads(line))
+                except ValueError: pass            # torn last line after a crash
+    except OSError:
+        pass
+    return moves
+
+def clear_undo_log():
+    try: UNDO_LOG.unlink()
+    except OSError: pass
+
 # ---------------------------------------------------------------
 # Utilities
 # ---------------------------------------------------------------
@@ -45,17 +75,67 @@ def normalize_ext(ext: str) -> str:
     ext = ext.strip().lower()
     return ext if not ext or ext.startswith('.') else '.' + ext
 
-def unique_path(dest: Path, name: str) -> Path:
-    target = dest / name
-    if not target.exists():
-        return target
-    stem, suf = target.stem, target.suffix
-    idx = 1
-    while True:
-        p = dest / f"{stem} ({idx}){suf}"
-        if not p.exists():
-            return p
-        idx += 1
+def file_ext(name: str) -> str:
+    # same result as PurePath.suffix.lower(), via a single rpartition
+    stem, _, ext = name.rpartition('.')
+    return '.' + ext.lower() if stem and ext else ''
+
+def _fold_name(name: str) -> str:
+    return unicodedata.normalize("NFC", name).casefold()
+
+def _is_case_insensitive(dest: Path, names) -> bool:
+    # ask the filesystem: does a swapped-case spelling of an entry in dest resolve
+    # to the same file? The folder's own name only shows how its parent looks up
+    # names, so it is the last resort. If nothing can be probed, assume
+    # insensitive: folding can only cause an extra rename, never an overwrite.
+    for cand in (*(dest / n for n in names), dest):
+        if cand.name == cand.name.swapcase(): continue   # no cased letters to probe with
+        try: return os.path.samefile(cand, cand.with_name(cand.name.swapcase()))
+        except OSError: return False
+    return True
+
+def unique_paths_batch(dest: Path, names: list[str]) -> list[Path]:
+    # one directory listing instead of a stat per probe; later names in the
+    # batch see the ones already handed out. Names are compared exactly unless
+    # this destination turns out to be case-insensitive (APFS, NTFS).
+    with os.scandir(dest) as it: existing = [e.name for e in it]
+    key = _fold_name if _is_case_insensitive(dest, existing) else str
+    taken = {key(n) for n in existing}
+    next_idx, out = {}, []
+    for name in names:
+        if key(name) in taken:
+            p = PurePath(name); stem, suf = p.stem, p.suffix
+            k = key(name); idx = next_idx.get(k, 1)
+            while key(f"{stem} ({idx}){suf}") in taken: idx += 1
+            next_idx[k] = idx + 1; name = f"{stem} ({idx}){suf}"
+        taken.add(key(name)); out.append(dest / name)
+    return out
+
+def _copy_data(src, dest):
+    # copy_file_range (Linux) keeps the copy in the kernel and lets NFS/SMB copy
+    # server-side; otherwise copyfile uses sendfile / fcopyfile / CopyFileW
+    if hasattr(os, "copy_file_range") and not os.path.islink(src):
+        try:
+            with open(src, "rb") as fs, open(dest, "wb") as fd:
+                left = os.fstat(fs.fileno()).st_size
+                while left > 0:
+                    n = os.copy_file_range(fs.fileno(), fd.fileno(), left)
+                    if n == 0: break                # unsupported (FUSE, overlayfs, CIFS) or source shrank
+                    left -= n
+            # a short copy must never be followed by unlinking the source
+            if left <= 0: return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP): raise
+    shutil.copyfile(src, dest, follow_symlinks=False)
+
+def move_file(src, dest):
+    # same-filesystem rename is a single syscall; across devices copy + unlink
+    try: os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV: raise
+        _copy_data(src, dest)
+        shutil.copystat(src, dest, follow_symlinks=False)
+        os.unlink(src)
 
 # ---------------------------------------------------------------
 # Fancy progress-painting push button
@@ -77,6 +157,43 @@ class ProgressButton(QPushButton):
             painter.fillRect(fill, self.palette().highlight())
         painter.drawControl(QStyle.CE_PushButtonLabel, opt)
 
+# ---------------------------------------------------------------
+# Preview model: rows are handed to the view in batches as it scrolls
+# ---------------------------------------------------------------
+class FolderModel(QAbstractListModel):
+    BATCH = 500
+    def __init__(self, dir_icon: QIcon, file_icon: QIcon, parent=None):
+        super().__init__(parent)
+        self._dir_icon, self._file_icon = dir_icon, file_icon
+        self._entries: list[tuple[str, bool]] = []    # (name, is_dir)
+        self._visible = 0
+    def set_entries(self, entries: list[tuple[str, bool]]):
+        self.beginResetModel()
+        self._entries = entries; self._visible = min(self.BATCH, len(entries))
+        self.endResetModel()
+    def apply_moves(self, removed: set[str], added_dirs: set[str]):
+        # patch the listing after a sort instead of rescanning the folder
+        rows = [e for e in self._entries if e[0] not in removed]
+        have = {name for name, _ in rows}
+        rows += [(name, True) for name in added_dirs if name not in have]
+        rows.sort(key=operator.itemgetter(0))
+        self.set_entries(rows)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._visible
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._visible < len(self._entries)
+    def fetchMore(self, parent):
+        n = min(self.BATCH, len(self._entries) - self._visible)
+        self.beginInsertRows(QModelIndex(), self._visible, self._visible + n - 1)
+        self._visible += n
+        self.endInsertRows()
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid(): return None
+        name, is_dir = self._entries[index.row()]
+        if role == Qt.DisplayRole: return name
+        if role == Qt.DecorationRole: return self._dir_icon if is_dir else self._file_icon
+        return None
+
 # ---------------------------------------------------------------
 # Background worker thread
 # ---------------------------------------------------------------
@@ -84,28 +201,100 @@ class SortWorker(QObject):
     progress = pyqtSignal(int, int)               # moved, total
     finished = pyqtSignal(list)                   # list[ (src, dest) ] for undo
     error    = pyqtSignal(str)
-    def __init__(self, root: Path, files: list[Path], rules: dict[str, str]):
+    folders_created = pyqtSignal(list)            # top-level names of new category folders
+    def __init__(self, root: Path, files: list[os.DirEntry | Path], rules: dict[str, str], max_workers: int = MAX_WORKERS):
         super().__init__()
         self.root, self.files, self.rules = root, files, rules
+        self.max_workers = max(1, max_workers)
+        self._stop = False
+    def stop(self):
+        # queued moves are skipped; ones already running finish and stay undoable
+        self._stop = True
+    def _move_one(self, src, dest) -> bool:
+        if self._stop: return False
+        move_file(src, dest); return True
     def run(self):
-        undo_moves = []
-        total = len(self.files)
-        done = 0
-        for src in self.files:
-            ext = src.suffix.lower()
-            folder = self.rules.get(ext, "Others")
+        # plan serially: mkdir + collision resolution must not race between threads.
+        # Grouping by category first means one mkdir and one listing per folder.
+        groups: dict[str, list[Path]] = defaultdict(list)
+        rules_get = self.rules.get                # locals: skip attribute lookups in hot loops
+        for src in self.files: groups[rules_get(file_ext(src.name), "Others")].append(src)
+        plan, new_folders = [], []
+        for folder, srcs in groups.items():
             dest_dir = self.root / folder
-            try: dest_dir.mkdir(parents=True, exist_ok=True)
+            if os.path.normpath(dest_dir) == os.path.normpath(self.root):
+                self.error.emit(f"Left {len(srcs)} file(s) in place: the rule for them points at the sorted folder itself")
+                continue
+            try:
+                try: dest_dir.mkdir(parents=True); new_folders.append(PurePath(folder).parts[0])
+                except FileExistsError: pass      # a file in the way fails in the listing below
+                dests = unique_paths_batch(dest_dir, [src.name for src in srcs])
             except Exception as e:
                 self.error.emit(f"Could not create {dest_dir}: {e}"); continue
-            dest = unique_path(dest_dir, src.name)
-            try: shutil.move(str(src), str(dest))
-            except Exception as e:
-                self.error.emit(f"Move failed for {src}: {e}"); continue
-            undo_moves.append((str(dest), str(src)))
-            done += 1; self.progress.emit(done, total)
+            plan.extend(zip(srcs, dests))
+        if new_folders: self.folders_created.emit(new_folders)
+        # moves are independent renames, overlap them on a thread pool
+        undo_moves = []; record = undo_moves.append
+        emit, monotonic, fspath = self.progress.emit, time.monotonic, os.fspath
+        total = len(plan)
+        if total and total != len(self.files): self.progress.emit(0, total)   # re-base the UI on what will move
+        done = last_done = 0; last_time = monotonic()
+        # append each move as it lands so an interrupted sort can still be undone
+        try: log = UNDO_LOG.open("wb")
+        except OSError: log = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futs = {pool.submit(self._move_one, src, dest): (src, dest) for src, dest in plan}
+            for fut in as_completed(futs):
+                src, dest = futs[fut]
+                try:
+                    if not fut.result(): continue
+                except Exception as e:
+                    self.error.emit(f"Move failed for {os.fspath(src)}: {e}"); continue
+                move = (fspath(dest), fspath(src)); record(move)
+                if log:
+                    try: log.write(_dumps(move) + b"\n"); log.flush()
+                    except OSError as e:
+                        # losing the on-disk copy must not stop the sort or the in-memory undo
+                        try: log.close()
+                        except OSError: pass
+                        log = None; self.error.emit(f"Could not write undo log {UNDO_LOG}: {e}")
+                done += 1
+                # cross-thread signals are queued events; don't post one per file
+                now = monotonic()
+                if done - last_done >= PROGRESS_EVERY or now - last_time > PROGRESS_INTERVAL or done == total:
+                    emit(done, total); last_done, last_time = done, now
+        if log:
+            try: log.close()
+            except OSError: pass
+        if done != last_done: emit(done, total)
         self.finished.emit(undo_moves)
 
+class UndoWorker(QObject):
+    finished = pyqtSignal(list)                   # list[str] of errors
+    def __init__(self, moves: list, max_workers: int = MAX_WORKERS):
+        super().__init__()
+        self.moves, self.max_workers = moves, max(1, max_workers)
+    def run(self):
+        errs = []
+        # move files back under their original names: resolve collisions against one
+        # listing per parent, then the renames are independent and run in parallel
+        groups = defaultdict(list)
+        for src, dest in self.moves: groups[os.path.dirname(dest)].append((src, dest))
+        plan = []
+        for parent, pairs in groups.items():
+            try: targets = unique_paths_batch(Path(parent), [os.path.basename(dest) for _, dest in pairs])
+            except OSError as e: errs.append(str(e)); continue
+            plan.extend((src, target) for (src, _), target in zip(pairs, targets))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for fut in [pool.submit(move_file, src, target) for src, target in plan]:
+                try: fut.result()
+                except Exception as e: errs.append(str(e))
+        # remove any now-empty dest folders; rmdir refuses non-empty ones for us
+        for folder in {os.path.dirname(src) for src, _ in self.moves}:
+            try: os.rmdir(folder)
+            except OSError: pass
+        self.finished.emit(errs)
+
 # ---------------------------------------------------------------
 # Settings dialog
 # ---------------------------------------------------------------
@@ -134,14 +323,20 @@ class SettingsDialog(QDialog):
     def _populate(self):
         tmp = {}
         for ext, folder in self._rules.items(): tmp.setdefault(folder, []).append(ext)
-        for folder, exts in tmp.items():
-            r=self.table.rowCount(); self.table.insertRow(r)
+        # size the table once rather than inserting (and re-laying out) row by row
+        self.table.setUpdatesEnabled(False); self.table.setRowCount(len(tmp))
+        for r, (folder, exts) in enumerate(tmp.items()):
             self.table.setItem(r,0,QTableWidgetItem(','.join(exts))); self.table.setItem(r,1,QTableWidgetItem(folder))
+        self.table.setUpdatesEnabled(True)
     def _add_row(self):
         r=self.table.rowCount(); self.table.insertRow(r); self.table.setItem(r,0,QTableWidgetItem(".ext")); self.table.setItem(r,1,QTableWidgetItem("Folder"))
     def _del_rows(self):
-        rows={i.row() for i in self.table.selectedIndexes()};
-        for r in sorted(rows, reverse=True): self.table.removeRow(r)
+        rows=sorted({i.row() for i in self.table.selectedIndexes()}, reverse=True)
+        # one removeRows per contiguous run of selected rows, bottom-up
+        while rows:
+            last=first=rows.pop(0)
+            while rows and rows[0]==first-1: first=rows.pop(0)
+            self.table.model().removeRows(first, last-first+1)
     def _save(self):
         new={}
         for row in range(self.table.rowCount()):
@@ -158,9 +353,11 @@ class SettingsDialog(QDialog):
 # Main UI
 # ---------------------------------------------------------------
 class FileOrganizerUI(QWidget):
-    def __init__(self):
+    def __init__(self, max_workers: int = MAX_WORKERS):
         super().__init__(); self.setWindowTitle("File Organizer"); self.resize(900,600)
-        self.rules = load_rules(); self.undo_moves=[]; self.current_root:Path|None=None; self.files: list[Path]=[]
+        self.max_workers=max_workers
+        style=QApplication.style(); self._dir_icon=style.standardIcon(QStyle.SP_DirIcon); self._file_icon=style.standardIcon(QStyle.SP_FileIcon)
+        self.rules = load_rules(); self.undo_moves=load_undo_log(); self.current_root:Path|None=None; self.files: list[os.DirEntry]=[]
         self._build_ui()
     # -------------------- UI Layout --------------------
     def _build_ui(self):
@@ -178,22 +375,33 @@ class FileOrganizerUI(QWidget):
         top.addWidget(browse); top.addWidget(self.path_edit); top.addWidget(self.settings_btn)
         main.addLayout(top)
         # ––– Preview list (vertical)
-        self.view=QListWidget(); self.view.setViewMode(QListWidget.ListMode); self.view.setIconSize(QSize(24,24))
-        self.view.setMovement(QListWidget.Static); self.view.setSelectionMode(QListWidget.NoSelection)
+        self.model=FolderModel(self._dir_icon,self._file_icon,self)
+        self.view=QListView(); self.view.setModel(self.model); self.view.setViewMode(QListView.ListMode); self.view.setIconSize(QSize(24,24))
+        self.view.setMovement(QListView.Static); self.view.setSelectionMode(QListView.NoSelection); self.view.setUniformItemSizes(True)
         main.addWidget(self.view,1)
         # ––– Bottom bar
         bottom=QHBoxLayout(); self.sort_btn=ProgressButton("Sort Files"); self.sort_btn.setFixedHeight(48); self.sort_btn.clicked.connect(self._start_sort)
-        self.undo_btn=QPushButton("Undo"); self.undo_btn.setFixedHeight(48); self.undo_btn.setEnabled(False); self.undo_btn.clicked.connect(self._undo)
+        self.undo_btn=QPushButton("Undo"); self.undo_btn.setFixedHeight(48); self.undo_btn.setEnabled(bool(self.undo_moves)); self.undo_btn.clicked.connect(self._undo)
         bottom.addWidget(self.sort_btn); bottom.addWidget(self.undo_btn); main.addLayout(bottom)
     # -------------------- Helpers --------------------
-    def _icon_for(self,p:Path):
-        s=QApplication.style(); return s.standardIcon(QStyle.SP_DirIcon) if p.is_dir() else s.standardIcon(QStyle.SP_FileIcon)
     def _load_preview(self):
-        self.view.clear(); self.files.clear()
-        if not (self.current_root and self.current_root.exists()): return
-        for entry in sorted(self.current_root.iterdir()):
-            self.view.addItem(QListWidgetItem(self._icon_for(entry), entry.name))
-            if entry.is_file(): self.files.append(entry)
+        self.files.clear()
+        if not (self.current_root and self.current_root.exists()): self.model.set_entries([]); return
+        with os.scandir(self.current_root) as it: entries=sorted(it,key=operator.attrgetter("name"))
+        rows=[]
+        for entry in entries:
+            rows.append((entry.name,entry.is_dir()))
+            # dotfiles (.DS_Store, .localized, …) belong to the folder itself; leave them in place
+            if entry.is_file(follow_symlinks=False) and not entry.name.startswith("."): self.files.append(entry)
+        # single model reset; the view fetches rows in batches as it scrolls
+        self.model.set_entries(rows)
+    def _warn_errors(self,title,header,errs):
+        # keep the dialog screen-sized: a preview in the body, everything under "Show Details…"
+        text=f"{header} ({len(errs)}):\n"+'\n'.join(errs[:ERRORS_SHOWN])
+        if len(errs)>ERRORS_SHOWN: text+=f"\n… and {len(errs)-ERRORS_SHOWN} more"
+        box=QMessageBox(QMessageBox.Warning,title,text,QMessageBox.Ok,self)
+        if len(errs)>ERRORS_SHOWN: box.setDetailedText('\n'.join(errs))
+        box.exec_()
     # -------------------- browse & settings --------------------
     def _browse(self):
         folder=QFileDialog.getExistingDirectory(self,"Select Folder");
@@ -211,39 +419,53 @@ class FileOrganizerUI(QWidget):
         if not self.files:
             QMessageBox.information(self,"Nothing to do","No files to move."); return
         self.sort_btn.setEnabled(False); self.undo_btn.setEnabled(False)
-        self.sort_btn.setText(f"Sorting… 0/{len(self.files)}"); self.sort_btn.set_progress(0)
-        self.thread=QThread(); self.worker=SortWorker(self.current_root,self.files.copy(),self.rules); self.worker.moveToThread(self.thread)
+        total=len(self.files); self.sort_btn.setText(f"Sorting… 0/{total}"); self.sort_btn.set_progress(0); self._last_pct=(0,total)
+        # reserve the widest label up front so progress text never re-flows the bottom bar
+        self.sort_btn.setMinimumWidth(self.sort_btn.fontMetrics().horizontalAdvance(f"Sorting… {total}/{total}")+32)
+        self.thread=QThread(); self.worker=SortWorker(self.current_root,self.files.copy(),self.rules,self.max_workers); self.worker.moveToThread(self.thread)
         self.thread.started.connect(self.worker.run); self.worker.progress.connect(self._on_progress)
-        self.worker.error.connect(lambda m: QMessageBox.warning(self,"Error",m))
+        self.worker.folders_created.connect(lambda names: self.model.apply_moves(set(),set(names)))
+        self._errs=[]; self.worker.error.connect(self._errs.append)   # one dialog at the end, not one per file
         self.worker.finished.connect(self._on_sorted); self.worker.finished.connect(self.thread.quit)
         self.thread.finished.connect(self.thread.deleteLater); self.thread.start()
     def _on_progress(self,moved,total):
-        self.sort_btn.set_progress(moved/total); self.sort_btn.setText(f"Sorting… {moved}/{total}")
+        # repaint at most once per whole percent, however often the worker reports
+        pct=moved*100//total
+        if (pct,total)==self._last_pct and moved!=total: return
+        self._last_pct=(pct,total); self.sort_btn.set_progress(moved/total); self.sort_btn.setText(f"Sorting… {moved}/{total}")
     def _on_sorted(self,moves):
-        self.undo_moves=moves; self.sort_btn.setText("Done!"); self.sort_btn.set_progress(1); self.sort_btn.setEnabled(True)
+        self.undo_moves=moves; self.sort_btn.setText("Done!"); self.sort_btn.set_progress(1); self.sort_btn.setEnabled(True); self.sort_btn.setMinimumWidth(0)
         if moves: self.undo_btn.setEnabled(True)
-        self._load_preview()
+        moved={os.path.basename(src) for _,src in moves}
+        self.files=[f for f in self.files if f.name not in moved]
+        self.model.apply_moves(moved,set())
+        if self._errs:
+            self._warn_errors("Sort issues","Some files couldn't be moved",self._errs)
+    def closeEvent(self,e):
+        # never let Qt destroy a running QThread: cut a sort short, let an undo finish
+        if not self.sort_btn.isEnabled():
+            if isinstance(self.worker,SortWorker): self.worker.stop()
+            self.thread.quit(); self.thread.wait()
+        super().closeEvent(e)
     # -------------------- undo --------------------
     def _undo(self):
         if not self.undo_moves: return
-        errs=[]
-        # move files back
-        for src,dest in self.undo_moves:
-            try: shutil.move(src,unique_path(Path(dest).parent,Path(src).name))
-            except Exception as e: errs.append(str(e))
-        # remove any now-empty dest folders
-        for src,dest in self.undo_moves:
-            folder=Path(src).parent
-            try:
-                if folder.exists() and not any(folder.iterdir()): folder.rmdir()
-            except OSError: pass
-        self.undo_moves.clear(); self.undo_btn.setEnabled(False)
+        self.sort_btn.setEnabled(False); self.undo_btn.setEnabled(False); self.sort_btn.setText("Undoing…")
+        self.thread=QThread(); self.worker=UndoWorker(self.undo_moves,self.max_workers); self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.run)
+        self.worker.finished.connect(self._on_undone); self.worker.finished.connect(self.thread.quit)
+        self.thread.finished.connect(self.thread.deleteLater); self.thread.start()
+    def _on_undone(self,errs):
+        self.undo_moves=[]; clear_undo_log()
         # reset sort button
-        self.sort_btn.setText("Sort Files"); self.sort_btn.set_progress(0)
+        self.sort_btn.setText("Sort Files"); self.sort_btn.set_progress(0); self.sort_btn.setEnabled(True)
         self._load_preview()
         if errs:
-            QMessageBox.warning(self,"Undo issues","Some files couldn't be restored:\n"+'\n'.join(errs))
+            self._warn_errors("Undo issues","Some files couldn't be restored",errs)
 
 # ---------------------------------------------------------------
 if __name__=="__main__":
-    app=QApplication(sys.argv); win=FileOrganizerUI(); win.show(); sys.exit(app.exec_())
+    ap=argparse.ArgumentParser(description="Sort a folder's files into category subfolders.")
+    ap.add_argument("--max-concurrency",type=int,default=MAX_WORKERS,help=f"parallel file moves (default: {MAX_WORKERS})")
+    args,qt_args=ap.parse_known_args()
+    app=QApplication(sys.argv[:1]+qt_args); win=FileOrganizerUI(args.max_concurrency); win.show(); sys.exit(app.exec_())